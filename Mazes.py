@@ -276,16 +276,49 @@ class Maze(object):
         self.cells = []
         self.valid = False
 
+        #per-cell strategy tables, filled in by compile()
+        self.greedy_table = {}
+        self.arbitrary_table = {}
+        self.neighbor_table = {}
+        self.alias_table = {}
+
     def valid_or_raise(self):
         if not self.valid:
             raise UninitializedObjectException("Maze not initialized")
 
-    #choices do not deal with blocked passages, as these are addressed in the make_route function
-    def choose_greedy(self, initial_cell):
+    def compile(self):
         """
-        Choose shortest path of the cell
+        Precomputes the strategy tables for every cell in the maze
+        Cells can't change passages once valid, so the tables never go stale
         """
-        possible_passages = initial_cell.passage_dict
+        self.valid_or_raise()
+
+        for cell in self.cells:
+            self.compile_cell(cell)
+
+    def compile_cell(self, cell):
+        """
+        Precomputes the strategy tables for a single cell of the maze
+        greedy_table holds the fastest destination, arbitrary_table the first connected one,
+        neighbor_table a tuple of connected cells and alias_table a Walker alias table over them
+        Dead ends are left out of greedy_table and arbitrary_table
+        """
+        neighbors = tuple(cell.connected_cells())
+
+        if cell.passage_dict:
+            self.greedy_table[cell] = self.fastest_passage(cell)
+        if neighbors:
+            self.arbitrary_table[cell] = neighbors[0]
+        self.neighbor_table[cell] = neighbors
+        self.alias_table[cell] = self.passage_alias_table(cell, neighbors)
+
+    @staticmethod
+    def fastest_passage(cell):
+        """
+        Returns the first fastest destination of the cell, blocked or not
+        Raises IndexError if the cell has no passages
+        """
+        possible_passages = cell.passage_dict
         fastest_cell = possible_passages.keys()[0]
         fastest_time = possible_passages[fastest_cell]
 
@@ -296,20 +329,93 @@ class Maze(object):
 
         return fastest_cell
 
+    @classmethod
+    def passage_alias_table(cls, cell, neighbors):
+        """
+        Builds the alias table over neighbors, weighting each by the inverse of its passage time
+        """
+        return cls.build_alias_table([1.0 / cell.passage_dict[neighbor] for neighbor in neighbors])
+
+    @staticmethod
+    def build_alias_table(weights):
+        """
+        Builds a Walker alias table for the given weights
+        Returns a tuple of (probabilities, aliases), one entry of each per weight
+        """
+        count = len(weights)
+        if count == 0:
+            return ((), ())
+
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        probabilities = [1.0] * count
+        aliases = range(count)
+
+        small = [index for index in range(count) if scaled[index] < 1.0]
+        large = [index for index in range(count) if scaled[index] >= 1.0]
+
+        #pair each underfull column with an overfull one that tops it up
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        #leftovers are only off from 1 by rounding error
+        return (tuple(probabilities), tuple(aliases))
+
+    #choices do not deal with blocked passages, as these are addressed in the make_route function
+    #only cells in the maze are compiled. Others, and dead ends, fall back to checking the cell itself
+    def choose_greedy(self, initial_cell):
+        """
+        Choose shortest path of the cell
+        """
+        try:
+            return self.greedy_table[initial_cell]
+        except KeyError:
+            return self.fastest_passage(initial_cell)
+
     def choose_arbitrary(self, initial_cell):
         """
         Chooses the first cell in the dictionary
         """
-        possible_cells = initial_cell.connected_cells()
-        return possible_cells[0];
+        try:
+            return self.arbitrary_table[initial_cell]
+        except KeyError:
+            return initial_cell.connected_cells()[0]
 
     def choose_random(self, initial_cell):
         """
         Chooses a random cell
         """
-        possible_cells = initial_cell.connected_cells()
+        try:
+            possible_cells = self.neighbor_table[initial_cell]
+        except KeyError:
+            possible_cells = initial_cell.connected_cells()
         return possible_cells[random.randint(0, len(possible_cells)-1)]
 
+    def choose_weighted(self, initial_cell):
+        """
+        Chooses a random cell, favoring faster passages
+        Each passage is picked with probability inversely proportional to its time
+        """
+        try:
+            possible_cells = self.neighbor_table[initial_cell]
+            probabilities, aliases = self.alias_table[initial_cell]
+        except KeyError:
+            possible_cells = initial_cell.connected_cells()
+            probabilities, aliases = self.passage_alias_table(initial_cell, possible_cells)
+
+        column = random.randint(0, len(possible_cells)-1)
+        if random.random() < probabilities[column]:
+            return possible_cells[column]
+        return possible_cells[aliases[column]]
+
     def generate_route(self, initial_cell, method):
         """
         This returns a route of cells that a randomly wandering "mouse" walks through
@@ -352,6 +458,7 @@ class Maze(object):
 
         self.cells = copy.copy(cells)
         self.valid = True
+        self.compile()
         return True
 
     def __str__(self):
@@ -262,6 +262,83 @@ class Test(TestCase):
         assert_equals(sys.maxint, self.__maze.average_exit_time(self.__cells[0] ,self.__maze.choose_random))      
         assert_equals(sys.maxint, self.__maze.average_exit_time(self.__cells[0] ,self.__maze.choose_greedy))      
 
+    def test_weighted_route(self):
+        assert_equals(False, self.__maze.valid)
+        self.__cells[4].add_passages({})
+        self.__maze.add_cells(self.__cells)
+        assert_equals(True, self.__maze.valid)
+
+        #tests generate_route method for weighted random
+        self.__maze.__route = self.__maze.generate_route(self.__cells[1], self.__maze.choose_weighted)
+
+        for cell in self.__maze.__route.get_cells():
+            assert_equals(True, cell.valid)
+
+        #blocked passage from cell 1 to 3 is never picked
+        for attempt in range(0, 20):
+            assert_equals(self.__cells[2], self.__maze.choose_weighted(self.__cells[1]))
+
+    def viertel_rand(self):
+        return 0.25
+
+    def dreiviertel_rand(self):
+        return 0.75
+
+    def test_weighted_alias_column(self):
+        assert_equals(False, self.__maze.valid)
+        self.__cells[4].add_passages({self.__cells[0]: 1, self.__cells[2]: 3})
+        self.__maze.add_cells(self.__cells)
+        assert_equals(True, self.__maze.valid)
+
+        #the slow column keeps itself half the time and aliases to the fast cell otherwise
+        neighbors = self.__maze.neighbor_table[self.__cells[4]]
+        slow_rand = [self.nein_rand, self.ein_rand][neighbors.index(self.__cells[2])]
+        fast_rand = [self.nein_rand, self.ein_rand][neighbors.index(self.__cells[0])]
+
+        with mock.patch.object(random, "randint", slow_rand):
+            with mock.patch.object(random, "random", self.viertel_rand):
+                assert_equals(self.__cells[2], self.__maze.choose_weighted(self.__cells[4]))
+            with mock.patch.object(random, "random", self.dreiviertel_rand):
+                assert_equals(self.__cells[0], self.__maze.choose_weighted(self.__cells[4]))
+
+        #the fast column always keeps itself
+        with mock.patch.object(random, "randint", fast_rand):
+            with mock.patch.object(random, "random", self.dreiviertel_rand):
+                assert_equals(self.__cells[0], self.__maze.choose_weighted(self.__cells[4]))
+
+    def test_alias_table(self):
+        #a passage 3 times as fast is 3 times as likely
+        probabilities, aliases = Mazes.Maze.build_alias_table([1.0, 1.0 / 3])
+        assert_equals((1.0, 0.5), probabilities)
+        assert_equals((0, 0), aliases)
+
+        assert_equals(((), ()), Mazes.Maze.build_alias_table([]))
+
+    def test_compiled_tables(self):
+        assert_equals(False, self.__maze.valid)
+        self.__cells[4].add_passages({})
+        self.__maze.add_cells(self.__cells)
+        assert_equals(True, self.__maze.valid)
+
+        assert_equals(self.__cells[2], self.__maze.greedy_table[self.__cells[1]])
+        assert_equals(self.__cells[2], self.__maze.arbitrary_table[self.__cells[1]])
+        assert_equals((self.__cells[2],), self.__maze.neighbor_table[self.__cells[1]])
+        assert_equals((), self.__maze.neighbor_table[self.__cells[4]])
+
+        #dead ends are left out and still fail at the call
+        assert_equals(False, self.__cells[4] in self.__maze.arbitrary_table)
+        assert_raises(IndexError, self.__maze.choose_arbitrary, self.__cells[4])
+        assert_raises(IndexError, self.__maze.choose_greedy, self.__cells[4])
+
+        #cells outside the maze are not compiled or kept
+        outside_cell = Mazes.MazeCell()
+        outside_cell.add_passages({self.__cells[0]: 2})
+        assert_equals(self.__cells[0], self.__maze.choose_greedy(outside_cell))
+        assert_equals(self.__cells[0], self.__maze.choose_arbitrary(outside_cell))
+        assert_equals(self.__cells[0], self.__maze.choose_weighted(outside_cell))
+        assert_equals(False, outside_cell in self.__maze.neighbor_table)
+        assert_equals(False, outside_cell in self.__maze.greedy_table)
+
     def tearDown(self):
         del self.__cells[:]
         del self.__route